@@ -24,7 +24,8 @@ Pull standings from the Pulselive standings endpoint and parse the 20-row league
 
 Phase B (enrichment)
 --------------------
-For each team, fetch the next scheduled league fixture and derive:
+For each team, find its next league fixture (from the following matchweek's fixtures,
+falling back to the team's nextfixture endpoint) and derive:
 - next_opponent_id
 - next_opponent_name
 - is_home_next (True if the team is the home team in its next fixture)
@@ -34,12 +35,21 @@ Output
 CSV history where each completed matchweek contributes exactly 20 rows.
 """
 
+import csv
 import os
-from datetime import datetime, timezone
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 
 
+import numpy as np
+import orjson
 import pandas as pd
 import requests
+from cachecontrol import CacheControlAdapter
+from cachecontrol.caches.file_cache import FileCache
+from urllib3.util.retry import Retry
 
 # -----------------------
 # Configuration constants
@@ -51,8 +61,30 @@ NEXTFIXTURE_URL_TMPL = (
     "https://sdp-prem-prod.premier-league-prod.pulselive.com/api/v1/"
     "competitions/8/seasons/2025/teams/{team_id}/nextfixture"
 )
+# Bound formatters for the per-call URL templates
+_mk_matches_url = MATCHWEEK_MATCHES_URL_TMPL.format
+_mk_fixture_url = NEXTFIXTURE_URL_TMPL.format
+
 HISTORY_CSV = "pl_standings_history.csv"
-HEADERS = {"User-Agent": "Mozilla/5.0"}
+WEB_CACHE_DIR = ".web_cache"
+STANDINGS_LM_FILE = ".pl_standings.lm"
+COMPLETE_MW_FILE = ".pl_matchweeks_complete.json"
+HEADERS = {"User-Agent": "Mozilla/5.0", "Accept": "application/json"}
+
+# One pooled keep-alive session for every synchronous call (all hit the same host).
+# The caching adapter stores ETag/Last-Modified validators on disk so repeat polls
+# revalidate with If-None-Match / If-Modified-Since; a 304 is served from cache.
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount(
+    "https://",
+    CacheControlAdapter(
+        cache=FileCache(WEB_CACHE_DIR),
+        pool_connections=1,
+        pool_maxsize=20,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    ),
+)
 
 PHASE_A_COLS = [
     "snapshot_utc",
@@ -70,51 +102,124 @@ PHASE_A_COLS = [
     "points",
 ]
 
+# Column dtypes: small ints sized to league-table ranges, team ids as strings (they
+# are compared against fixture ids). Also valid for reading the CSV back.
+PHASE_A_DTYPES = {
+    "season_id": "int32",
+    "matchweek": "int8",
+    "position": "int8",
+    "team_id": "str",
+    "won": "int8",
+    "drawn": "int8",
+    "lost": "int8",
+    "goalsFor": "int16",
+    "goalsAgainst": "int16",
+    "goal_difference": "int16",
+    "points": "int16",
+}
+
 COLS = PHASE_A_COLS + ["next_opponent_id", "next_opponent_name", "is_home_next"]
 
 
-def fetch_standings_json(url: str) -> dict:
+def fetch_standings_json(url: str, if_modified_since: str | None = None) -> dict | None:
     """
     Fetch the Pulselive standings payload as JSON.
 
+    On a 200 that carries a Last-Modified header, the stamp is persisted to
+    STANDINGS_LM_FILE together with the payload's matchweek, so a later run can
+    make a conditional request (see read_standings_stamp()).
+
     Args:
         url: Pulselive standings endpoint URL.
+        if_modified_since: Optional Last-Modified value from a previous run. When
+            given, it is sent as If-Modified-Since.
 
     Returns:
-        Parsed JSON response as a Python dict.
+        Parsed JSON response as a Python dict, or None if the server answered
+        304 Not Modified.
 
     Raises:
-        requests.HTTPError: If the response status is not 2xx.
+        requests.HTTPError: If the response status is not 2xx (or 304).
         requests.RequestException: For network-related errors (timeouts, etc.).
         ValueError: If the response body is not valid JSON.
     """
-    r = requests.get(url, headers=HEADERS, timeout=30)
+    headers = {"If-Modified-Since": if_modified_since} if if_modified_since else {}
+    r = SESSION.get(url, timeout=30, headers=headers)
+    if r.status_code == 304:
+        return None
     r.raise_for_status()
-    return r.json()
+    standings_json = orjson.loads(r.content)
+
+    last_modified = r.headers.get("Last-Modified")
+    if last_modified and "matchweek" in standings_json:
+        stamp = {
+            "last_modified": last_modified,
+            "matchweek": standings_json["matchweek"],
+        }
+        with open(STANDINGS_LM_FILE, "wb") as f:
+            f.write(orjson.dumps(stamp, option=orjson.OPT_APPEND_NEWLINE))
 
+    return standings_json
 
-def is_matchweek_complete(matchweek: int) -> bool:
+
+def read_standings_stamp() -> tuple[str, int] | None:
     """
-    Determine whether a matchweek is fully complete.
+    Read the Last-Modified stamp persisted by fetch_standings_json().
+
+    Returns:
+        (last_modified, matchweek) from the last 200 standings response, or None
+        if no usable stamp exists.
+    """
+    try:
+        with open(STANDINGS_LM_FILE, "rb") as f:
+            stamp = orjson.loads(f.read())
+        return stamp["last_modified"], int(stamp["matchweek"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
 
-    A matchweek is considered complete when:
-    - the matchweek contains exactly 10 matches (20 teams), and
-    - all matches have period == "FullTime"
+
+def fetch_matchweek_matches(matchweek: int) -> list:
+    """
+    Fetch every match scheduled in a given matchweek.
 
     Args:
-        matchweek: Matchweek number to check.
+        matchweek: Matchweek number to fetch.
 
     Returns:
-        True if the matchweek appears complete, otherwise False.
+        List of match objects (each with homeTeam, awayTeam and period).
+        Empty list if the payload has no "data" entries.
 
     Raises:
         requests.HTTPError: If the matches endpoint returns a non-2xx status.
         requests.RequestException: For network-related errors (timeouts, etc.).
         ValueError: If the response body is not valid JSON.
     """
+    url = _mk_matches_url(matchweek=matchweek)
+
+    r = SESSION.get(url, timeout=30, params={"_limit": 100})
+    r.raise_for_status()
+    return orjson.loads(r.content).get("data", [])
+
+
+def _read_complete_matchweeks() -> dict[str, set[int]]:
+    """
+    Read the matchweeks already known to be complete (see is_matchweek_complete()).
+
+    Returns:
+        Dict of season_id (str) -> set of matchweek numbers; empty if the file is
+        missing, unreadable, or not a season-keyed object.
+    """
+    try:
+        with open(COMPLETE_MW_FILE, "rb") as f:
+            data = orjson.loads(f.read())
+        return {str(season): set(mws) for season, mws in data.items()}
+    except (OSError, ValueError, TypeError, AttributeError):
+        return {}
 
 
-def is_matchweek_complete(matchweek: int) -> bool:
+def is_matchweek_complete(
+    matchweek: int, season_id: int | str, prefetched: tuple[int, list] | None = None
+) -> bool:
     """
     Determine whether a matchweek is fully complete.
 
@@ -123,56 +228,79 @@ def is_matchweek_complete(matchweek: int) -> bool:
     - 20 unique teams appear across the fixtures (covers normal weeks and avoids
       partial/duplicate data issues).
 
+    A completed matchweek never changes, so positive results are persisted to
+    COMPLETE_MW_FILE and answered from there without a request. The file is keyed
+    by season, so a result never carries over to the same matchweek number of a
+    later season. Incomplete results are not persisted; their refetches are
+    revalidated by the caching adapter (If-None-Match), so an unchanged matches
+    payload costs a 304.
+
     Args:
         matchweek: Matchweek number to check.
+        season_id: Season the matchweek belongs to (from the standings payload).
+        prefetched: Optional (matchweek, matches) already fetched by the caller
+            (see main()). Used instead of a request only when its matchweek is the
+            one being checked.
 
     Returns:
         True if the matchweek appears complete, otherwise False.
 
     Raises:
-        requests.HTTPError: If the matches endpoint returns a non-2xx status.
-        requests.RequestException: For network-related errors (timeouts, etc.).
-        ValueError: If the response body is not valid JSON.
+        requests.HTTPError / requests.RequestException / ValueError:
+            Propagated from fetch_matchweek_matches().
     """
-    url = MATCHWEEK_MATCHES_URL_TMPL.format(matchweek=matchweek)
-
-    r = requests.get(url, headers=HEADERS, timeout=30, params={"_limit": 100})
-    r.raise_for_status()
-    j = r.json()
-
-    matches = j.get("data", [])
-    if not matches:
-        return False
+    complete = _read_complete_matchweeks()
+    season_key = str(season_id)
+    if matchweek in complete.get(season_key, set()):
+        return True
 
-    if any(m.get("period") != "FullTime" for m in matches):
+    if prefetched is not None and prefetched[0] == matchweek:
+        matches = prefetched[1]
+    else:
+        matches = fetch_matchweek_matches(matchweek)
+    # Fewer than 10 fixtures can never cover 20 teams
+    if len(matches) < 10:
         return False
 
+    # Single pass: bail out on the first unfinished match while collecting teams
     team_ids = set()
     for m in matches:
-        home = m.get("homeTeam", {})
-        away = m.get("awayTeam", {})
-        if home.get("id") is not None:
-            team_ids.add(str(home["id"]))
-        if away.get("id") is not None:
-            team_ids.add(str(away["id"]))
-
-    # 🔍 Optional debug (safe to leave in or remove later)
-    print(
-        f"matchweek={matchweek} "
-        f"matches={len(matches)} "
-        f"periods={set(m.get('period') for m in matches)} "
-        f"teams={len(team_ids)}"
-    )
+        if m.get("period") != "FullTime":
+            return False
+        home_id = m.get("homeTeam", {}).get("id")
+        away_id = m.get("awayTeam", {}).get("id")
+        if home_id is not None:
+            team_ids.add(str(home_id))
+        if away_id is not None:
+            team_ids.add(str(away_id))
+
+    if os.environ.get("DEBUG"):
+        print(f"matchweek={matchweek} matches={len(matches)} teams={len(team_ids)}")
+
+    if len(team_ids) != 20:
+        return False
+
+    complete.setdefault(season_key, set()).add(matchweek)
+    payload = {season: sorted(mws) for season, mws in complete.items()}
+    with open(COMPLETE_MW_FILE, "wb") as f:
+        f.write(orjson.dumps(payload, option=orjson.OPT_APPEND_NEWLINE))
+    return True
 
-    return len(team_ids) == 20
+
+# Pulls every stat parse_standings() needs from an entry's "overall" dict in one
+# C-level call, returning a tuple in the order the loop unpacks it
+_extract_overall = itemgetter(
+    "position", "won", "drawn", "lost", "goalsFor", "goalsAgainst", "points"
+)
 
 
-def parse_standings(url: str) -> pd.DataFrame:
+def parse_standings(
+    standings_json: dict, prefetched: tuple[int, list] | None = None
+) -> pd.DataFrame:
     """
     Parse the league table standings for the current matchweek.
 
     This function performs Phase A:
-    - Fetch standings JSON.
     - Gate on matchweek completion.
     - Parse a 20-row league table into a tidy DataFrame.
 
@@ -182,7 +310,8 @@ def parse_standings(url: str) -> pd.DataFrame:
         - Defensive checks are included to detect schema or payload changes.
 
     Args:
-        url: Pulselive standings endpoint URL.
+        standings_json: Standings payload from fetch_standings_json().
+        prefetched: Optional (matchweek, matches), passed to is_matchweek_complete().
 
     Returns:
         DataFrame with one row per team (20 rows) and columns PHASE_A_COLS.
@@ -190,12 +319,11 @@ def parse_standings(url: str) -> pd.DataFrame:
 
     Raises:
         RuntimeError: If the standings payload is missing expected keys or has an
-            unexpected structure (e.g., not 20 entries, positions not 1..20).
+            unexpected structure (e.g., not 20 entries, positions not 1..20, stats
+            out of range for their column dtype).
         requests.HTTPError / requests.RequestException / ValueError:
-            Propagated from fetch_standings_json().
+            Propagated from is_matchweek_complete().
     """
-    standings_json = fetch_standings_json(url)
-
     # Minimum defensive checks. This keeps the “defensive parsing” requirement.
     if "tables" not in standings_json or not standings_json["tables"]:
         raise RuntimeError("No tables found in JSON.")
@@ -205,57 +333,85 @@ def parse_standings(url: str) -> pd.DataFrame:
     if len(entries) != 20:
         raise RuntimeError(f"Expected 20 entries, got {len(entries)}")
 
-    snapshot_utc = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    # Same format as datetime.now(timezone.utc).isoformat(timespec="seconds")
+    snapshot_utc = time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime())
     season_id = standings_json["season"]["id"]
     matchweek = standings_json["matchweek"]
 
-    all_rows = []
-
-    if not is_matchweek_complete(matchweek):
+    if not is_matchweek_complete(matchweek, season_id, prefetched):
         return pd.DataFrame(columns=PHASE_A_COLS)
 
-    for entry in entries:
-        overall = entry["overall"]
+    # Struct-of-arrays: one preallocated typed array per numeric column, filled by
+    # index (no per-row dicts, no dtype inference when building the frame)
+    n = len(entries)
+    positions = np.empty(n, dtype=PHASE_A_DTYPES["position"])
+    won = np.empty(n, dtype=PHASE_A_DTYPES["won"])
+    drawn = np.empty(n, dtype=PHASE_A_DTYPES["drawn"])
+    lost = np.empty(n, dtype=PHASE_A_DTYPES["lost"])
+    goals_for = np.empty(n, dtype=PHASE_A_DTYPES["goalsFor"])
+    goals_against = np.empty(n, dtype=PHASE_A_DTYPES["goalsAgainst"])
+    points = np.empty(n, dtype=PHASE_A_DTYPES["points"])
+    team_ids = [None] * n
+    team_names = [None] * n
+
+    for i, entry in enumerate(entries):
         team = entry["team"]
 
-        position = overall["position"]
-        team_id = team["id"]
-        team_name = team["shortName"]
-        won = overall["won"]
-        drawn = overall["drawn"]
-        lost = overall["lost"]
-        goalsFor = overall["goalsFor"]
-        goalsAgainst = overall["goalsAgainst"]
-        goals_difference = goalsFor - goalsAgainst
-        points = overall["points"]
-
-        # Populate columns
-        all_rows.append(
-            {
-                "snapshot_utc": snapshot_utc,
-                "season_id": season_id,
-                "matchweek": matchweek,
-                "position": position,
-                "team_id": team_id,
-                "team_name": team_name,
-                "won": won,
-                "drawn": drawn,
-                "lost": lost,
-                "goalsFor": goalsFor,
-                "goalsAgainst": goalsAgainst,
-                "goal_difference": goals_difference,
-                "points": points,
-            }
-        )
+        # Out-of-range values overflow the small-int arrays; surface that schema
+        # drift as the documented RuntimeError rather than a NumPy OverflowError
+        try:
+            (
+                positions[i],
+                won[i],
+                drawn[i],
+                lost[i],
+                goals_for[i],
+                goals_against[i],
+                points[i],
+            ) = _extract_overall(entry["overall"])
+        except OverflowError as e:
+            raise RuntimeError(f"Standings value out of range: {e}") from e
+        team_ids[i] = str(team["id"])
+        team_names[i] = team["shortName"]
+
+    # Sanity check for any odd payloads: XOR one bit per position; with 20 entries,
+    # only positions 1..20 each seen once leave exactly bits 1..20 set (a duplicate
+    # clears its bit, out-of-range positions set bits outside the mask)
+    mask = 0
+    for p in positions.tolist():
+        mask ^= 1 << max(p, 0)
+    if mask != (1 << 21) - 2:
+        raise RuntimeError("Positions are not exactly 1...20.")
 
-    df = pd.DataFrame(all_rows)
+    df = pd.DataFrame(
+        {
+            "position": positions,
+            "team_id": team_ids,
+            "team_name": team_names,
+            "won": won,
+            "drawn": drawn,
+            "lost": lost,
+            "goalsFor": goals_for,
+            "goalsAgainst": goals_against,
+            "goal_difference": np.subtract(
+                goals_for, goals_against, dtype=PHASE_A_DTYPES["goal_difference"]
+            ),
+            "points": points,
+        }
+    )
     if df.empty:
         raise RuntimeError("Parsed 0 rows - PL standings structure may have changed.")
 
-    # Sanity check for any odd payloads
-    positions = sorted([row["position"] for row in all_rows])
-    if positions != list(range(1, 21)):
-        raise RuntimeError("Positions are not exactly 1...20.")
+    # Snapshot-level values are scalars broadcast across all rows
+    df["snapshot_utc"] = snapshot_utc
+    df["season_id"] = season_id
+    df["matchweek"] = matchweek
+    df = df.astype(
+        {
+            "season_id": PHASE_A_DTYPES["season_id"],
+            "matchweek": PHASE_A_DTYPES["matchweek"],
+        }
+    )
     return df[PHASE_A_COLS]
 
 
@@ -277,10 +433,10 @@ def fetch_next_fixture_json(team_id: str) -> dict:
         requests.RequestException: For network-related errors (timeouts, etc.).
         ValueError: If the response body is not valid JSON.
     """
-    url = NEXTFIXTURE_URL_TMPL.format(team_id=team_id)
-    r = requests.get(url, headers=HEADERS, timeout=30)
+    url = _mk_fixture_url(team_id=team_id)
+    r = SESSION.get(url, timeout=30)
     r.raise_for_status()
-    return r.json()
+    return orjson.loads(r.content)
 
 
 def extract_next_opponent(team_id: str, fixture: dict) -> tuple[str, str, bool]:
@@ -293,7 +449,8 @@ def extract_next_opponent(team_id: str, fixture: dict) -> tuple[str, str, bool]:
     - whether the input team is playing at home (is_home_next)
 
     Args:
-        team_id: Team id for which we are extracting opponent information.
+        team_id: Team id (already a string) for which we are extracting opponent
+            information.
         fixture: nextfixture JSON (match object) for the given team.
 
     Returns:
@@ -307,18 +464,17 @@ def extract_next_opponent(team_id: str, fixture: dict) -> tuple[str, str, bool]:
 
     home_id = str(home.get("id"))
     away_id = str(away.get("id"))
-    team_id = str(team_id)
 
     if team_id == home_id:
         return (
-            str(away.get("id")),
+            away_id,
             away.get("shortName") or away.get("name"),
             True,
         )
 
     if team_id == away_id:
         return (
-            str(home.get("id")),
+            home_id,
             home.get("shortName") or home.get("name"),
             False,
         )
@@ -326,14 +482,53 @@ def extract_next_opponent(team_id: str, fixture: dict) -> tuple[str, str, bool]:
     raise RuntimeError(f"Team {team_id} not found in nextfixture match.")
 
 
+def build_next_opponent_map(matches: list) -> dict[str, tuple[str, str, bool]]:
+    """
+    Derive next opponent metadata for every team from one matchweek's fixtures.
+
+    Each match yields an entry for both sides, so a single matches payload covers
+    all teams playing that matchweek. Only fixtures still in period "PreMatch" are
+    used (a match brought forward and already played is not "next"), and teams
+    with more than one fixture in the payload are left out because their next
+    one is ambiguous. Teams left out are resolved by the nextfixture fallback in
+    add_next_opponents().
+
+    Args:
+        matches: Match objects from fetch_matchweek_matches().
+
+    Returns:
+        Dict of team_id (str) -> (opponent_id, opponent_name, is_home_next), the
+        same tuple shape as extract_next_opponent().
+    """
+    opponents = {}
+    fixture_counts = {}
+    for m in matches:
+        home = m.get("homeTeam", {})
+        away = m.get("awayTeam", {})
+        if home.get("id") is None or away.get("id") is None:
+            continue
+
+        home_id = str(home["id"])
+        away_id = str(away["id"])
+        fixture_counts[home_id] = fixture_counts.get(home_id, 0) + 1
+        fixture_counts[away_id] = fixture_counts.get(away_id, 0) + 1
+
+        if m.get("period") != "PreMatch":
+            continue
+        opponents[home_id] = (away_id, away.get("shortName") or away.get("name"), True)
+        opponents[away_id] = (home_id, home.get("shortName") or home.get("name"), False)
+
+    return {t: opp for t, opp in opponents.items() if fixture_counts[t] == 1}
+
+
 def add_next_opponents(df: pd.DataFrame) -> pd.DataFrame:
     """
     Enrich a standings DataFrame with next opponent metadata (Phase B).
 
-    For each row (team) in the standings table, this function:
-    - fetches the team's nextfixture match payload
-    - extracts opponent id/name and home/away status
-    - adds columns: next_opponent_id, next_opponent_name, is_home_next
+    Next opponents are derived from the following matchweek's fixtures, fetched
+    once for the whole table. Teams missing from that matchweek (e.g. a postponed
+    match) fall back to their nextfixture payload, fetched concurrently.
+    Adds columns: next_opponent_id, next_opponent_name, is_home_next.
 
     Args:
         df: Standings DataFrame from parse_standings() (PHASE_A_COLS).
@@ -344,38 +539,97 @@ def add_next_opponents(df: pd.DataFrame) -> pd.DataFrame:
 
     Raises:
         requests.HTTPError / requests.RequestException / ValueError:
-            Propagated from fetch_next_fixture_json().
+            Propagated from fetch_matchweek_matches() / fetch_next_fixture_json().
         RuntimeError:
             Propagated from extract_next_opponent() if fixture structure is unexpected.
     """
     if df.empty:
         return df
 
-    next_ids = []
-    next_names = []
-    next_home_flags = []
+    next_matchweek = int(df["matchweek"].iloc[0]) + 1
+    opponents = build_next_opponent_map(fetch_matchweek_matches(next_matchweek))
 
-    for team_id in df["team_id"]:
-        fixture = fetch_next_fixture_json(team_id)
-        opp_id, opp_name, is_home = extract_next_opponent(team_id, fixture)
-        next_ids.append(opp_id)
-        next_names.append(opp_name)
-        next_home_flags.append(is_home)
+    team_ids = df["team_id"].tolist()
+    missing = [t for t in team_ids if t not in opponents]
+    if missing:
+        # Threads share SESSION's connection pool (pool_maxsize=20)
+        with ThreadPoolExecutor(max_workers=len(missing)) as ex:
+            fixtures = list(ex.map(fetch_next_fixture_json, missing))
+        for team_id, fixture in zip(missing, fixtures):
+            opponents[team_id] = extract_next_opponent(team_id, fixture)
 
     df = df.copy()
-    df["next_opponent_id"] = next_ids
-    df["next_opponent_name"] = next_names
-    df["is_home_next"] = next_home_flags
+    df["next_opponent_id"] = [opponents[t][0] for t in team_ids]
+    df["next_opponent_name"] = [opponents[t][1] for t in team_ids]
+    df["is_home_next"] = [opponents[t][2] for t in team_ids]
     return df
 
 
+def _max_mw_sidecar(history_csv: str) -> str:
+    """
+    Path of the sidecar file caching the last recorded matchweek.
+
+    e.g. pl_standings_history.csv -> .pl_standings_history.max_mw (same directory).
+    """
+    head, tail = os.path.split(history_csv)
+    return os.path.join(head, f".{os.path.splitext(tail)[0]}.max_mw")
+
+
+def last_recorded_matchweek(history_csv: str) -> int | None:
+    """
+    Return the highest matchweek already stored in the history CSV.
+
+    The value is read in O(1) from the sidecar written by append_history(). If the
+    sidecar is missing, unreadable, or older than the CSV (history changed without
+    it), fall back to the CSV itself: history is append-only and written in
+    matchweek order, so only the header and the last snapshot (20 rows) are read.
+
+    Args:
+        history_csv: Path to the append-only CSV file.
+
+    Returns:
+        The last recorded matchweek, or None if there is no usable history yet.
+    """
+    if not os.path.exists(history_csv):
+        return None
+
+    sidecar = _max_mw_sidecar(history_csv)
+    try:
+        if os.path.getmtime(sidecar) >= os.path.getmtime(history_csv):
+            with open(sidecar) as f:
+                return int(f.read())
+    except (OSError, ValueError):
+        pass
+
+    with open(history_csv, newline="") as f:
+        header = next(csv.reader([f.readline()]), [])
+        tail = deque(f, maxlen=20)
+
+    if "matchweek" not in header or not tail:
+        return None
+
+    idx = header.index("matchweek")
+    return max(int(row[idx]) for row in csv.reader(tail) if row)
+
+
+def _write_max_mw(history_csv: str, matchweek: int):
+    """
+    Record the last appended matchweek in the sidecar next to history_csv.
+
+    Written after the CSV so its mtime is never older than the data it describes.
+    """
+    with open(_max_mw_sidecar(history_csv), "w") as f:
+        f.write(str(int(matchweek)))
+
+
 def append_history(df_new: pd.DataFrame, history_csv: str):
     """
     Append a completed matchweek snapshot to the history CSV (append-only).
 
     Dedupe policy:
         - A matchweek is stored at most once.
-        - If the history file already contains the matchweek number, the append is skipped.
+        - Matchweeks are appended in increasing order, so if the matchweek is not
+          newer than the last recorded one, the append is skipped.
 
     Args:
         df_new: Snapshot DataFrame to append (should contain COLS and 20 rows).
@@ -389,25 +643,30 @@ def append_history(df_new: pd.DataFrame, history_csv: str):
         return
 
     matchweek = df_new["matchweek"].iloc[0]
+    rows = df_new[COLS].itertuples(index=False, name=None)
 
     # If history exists, dedupe by matchweek (append-only snapshots)
     if os.path.exists(history_csv):
-        hist = pd.read_csv(history_csv)
-
-        # last saved matchweek
-        saved_matchweeks = set(hist["matchweek"])
-        if matchweek in saved_matchweeks:
+        # last saved matchweek (append-only and monotonic, so max() is enough)
+        last_mw = last_recorded_matchweek(history_csv)
+        if last_mw is not None and matchweek <= last_mw:
             print(f"Matchweek {matchweek} already recorded. Skipping append.")
             return
 
-        df_new.to_csv(history_csv, mode="a", header=False, index=False)
+        with open(history_csv, "a", newline="") as f:
+            csv.writer(f, lineterminator="\n").writerows(rows)
         print(f"Appended {len(df_new)} rows for matchweek {matchweek}.")
+        _write_max_mw(history_csv, matchweek)
     else:
         # first run: write header
-        df_new.to_csv(history_csv, index=False)
+        with open(history_csv, "w", newline="") as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(COLS)
+            writer.writerows(rows)
         print(
             f"Created {history_csv} with {len(df_new)} rows for matchweek {matchweek}."
         )
+        _write_max_mw(history_csv, matchweek)
 
 
 def main():
@@ -415,14 +674,54 @@ def main():
     Orchestrate standings snapshot creation and persistence.
 
     Flow:
-        1) Parse standings (Phase A). If matchweek is incomplete, exit early.
-        2) Enrich with next opponent data (Phase B).
-        3) Append to history CSV if this matchweek is not already recorded.
+        1) Fetch standings. If its matchweek is already recorded, exit early
+           (skips the completion check and Phase B entirely). When the last
+           standings response was for an already-recorded matchweek, the fetch is
+           conditional and a 304 Not Modified also exits early.
+        2) Parse standings (Phase A). If matchweek is incomplete, exit early.
+        3) Enrich with next opponent data (Phase B).
+        4) Append to history CSV if this matchweek is not already recorded.
 
     Returns:
         None
     """
-    df_new = parse_standings(STANDINGS_URL)
+    last_mw = last_recorded_matchweek(HISTORY_CSV)
+
+    # Only trust a 304 when the unchanged payload's matchweek is already recorded;
+    # otherwise the body is still needed to (re)check completion.
+    stamp = read_standings_stamp()
+    matches_future = None
+    if stamp is not None and last_mw is not None and stamp[1] <= last_mw:
+        standings_json = fetch_standings_json(STANDINGS_URL, if_modified_since=stamp[0])
+        if standings_json is None:
+            print(f"Standings unchanged since matchweek {stamp[1]}. Exiting.")
+            return
+    elif stamp is not None:
+        # The last standings seen were for a matchweek not yet recorded, so the
+        # completion check will most likely need that matchweek's matches. Overlap
+        # the two fetches; the result is handed to the check below if the guess holds.
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            standings_future = ex.submit(fetch_standings_json, STANDINGS_URL)
+            matches_future = ex.submit(fetch_matchweek_matches, stamp[1])
+        standings_json = standings_future.result()
+    else:
+        # No stamp: nothing suggests a completion check is coming, so don't make the
+        # common "already recorded" exit wait on a speculative request.
+        standings_json = fetch_standings_json(STANDINGS_URL)
+
+    if last_mw is not None and standings_json["matchweek"] <= last_mw:
+        print(f"Matchweek {standings_json['matchweek']} already recorded. Exiting.")
+        return
+
+    # A failed speculative fetch is not fatal: the completion check refetches
+    prefetched = None
+    if matches_future is not None:
+        try:
+            prefetched = (stamp[1], matches_future.result())
+        except (requests.RequestException, ValueError):
+            pass
+
+    df_new = parse_standings(standings_json, prefetched)
     if df_new.empty:
         print("No completed matchweek snapshot available. Exiting.")
         return